@@ -12,22 +12,34 @@
 # 1. Fetches tender data from the Eskom API endpoint.
 # 2. Handles potential network errors or invalid API responses.
 # 3. Iterates through each tender item in the response.
-# 4. Validates and parses each item into a structured EskomTender object.
+# 4. Validates and parses each item directly into an EskomTender dictionary.
 # 5. Skips and logs any items that fail validation.
-# 6. Converts the processed tender objects into dictionaries.
-# 7. Batches the tender data into groups of 10.
-# 8. Sends each batch to a specified SQS FIFO queue.
-# 9. Logs the outcome of the entire operation.
+# 6. Batches the tender data into groups of 10 as it is processed.
+# 7. Sends each batch to a specified SQS FIFO queue as soon as it is full, several at a time.
+# 8. Logs the outcome of the entire operation.
 #
 # ==================================================================================================
 
 # --- Import necessary libraries ---
-import json         # For serializing Python dictionaries to JSON strings.
+import json         # For (de)serializing JSON when orjson is not available.
+import hashlib      # For deriving SQS deduplication IDs from message content.
 import requests     # For making HTTP requests to the Eskom API.
+from requests.adapters import HTTPAdapter  # For configuring connection pooling and retries.
+from urllib3.util.retry import Retry       # For retrying transient API failures.
 import logging      # For logging information and errors.
 import boto3        # The AWS SDK for Python, used to interact with SQS.
+from datetime import datetime  # For serializing tender dates in the stdlib JSON fallback.
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait  # For sending SQS batches concurrently.
 from models import EskomTender  # Import the data model for Eskom tenders.
 
+# orjson is an optional, C-accelerated JSON library. When it is bundled in the Lambda layer it is
+# used to parse the API response and serialize outgoing payloads; otherwise we fall back to the
+# standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Global Constants and Configuration ---
 
 # The URL of the Eskom Tender Bulletin API.
@@ -39,6 +51,35 @@ HEADERS = {
     'Accept': 'application/json',
 }
 
+# --- HTTP Session Initialization ---
+# A module-level session is created once per Lambda container and reused across warm invocations.
+# It keeps the HTTPS connection to the Eskom API alive, so repeated invocations skip the TCP and
+# TLS handshakes, and it applies the browser-like headers to every request.
+http_session = requests.Session()
+http_session.headers.update(HEADERS)
+# (connect, read) timeout in seconds for each attempt against the Eskom API. The read timeout keeps
+# the original 30 s, so a slow but healthy bulletin response still succeeds. Read timeouts are not
+# retried (read=0 below), so a hung API fails after a single 30 s wait. Only connection failures and
+# the error statuses in status_forcelist are retried, and each retry has a 5 s connect budget.
+ESKOM_API_TIMEOUT = (5, 30)
+# Mount an adapter with a sized connection pool and automatic retries. Transient rate-limit and
+# server errors are retried with exponential backoff, so a single 5xx from the API no longer fails
+# the whole invocation. Once retries are exhausted, requests raises a RequestException as before.
+# - read=0: a read timeout is not retried, since a hung API is unlikely to recover within the budget.
+# - respect_retry_after_header=False: a 429 Retry-After header cannot stretch the wait past the
+#   backoff schedule above.
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False,
+    ),
+))
+
 # --- Logger Setup ---
 # Get the default Lambda logger instance.
 logger = logging.getLogger()
@@ -50,6 +91,160 @@ logger.setLevel(logging.INFO)
 sqs_client = boto3.client('sqs')
 # The URL of the target SQS FIFO (First-In, First-Out) queue.
 SQS_QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/211635102441/AIQueue.fifo'
+# All Eskom tenders share one FIFO message group.
+SQS_MESSAGE_GROUP_ID = 'EskomTenderScrape'
+# SQS `send_message_batch` has a limit of 10 messages per call.
+SQS_BATCH_SIZE = 10
+# Entry Ids only need to be unique within a single batch, so one fixed set is built at import time
+# and reused for every batch instead of formatting a new Id string for each message.
+SQS_ENTRY_IDS = tuple(f'tender_message_{i}' for i in range(SQS_BATCH_SIZE))
+# The number of SQS batches that may be in flight at the same time. Each send is a network round
+# trip, so overlapping them hides most of the latency. boto3 clients are safe to share across threads.
+SQS_MAX_WORKERS = 8
+
+# ==================================================================================================
+# Helper: JSON Serialization
+# ==================================================================================================
+def _json_default(obj):
+    """
+    Serializes types the standard library encoder does not support natively. Tender dictionaries
+    carry datetime objects, which orjson encodes as ISO 8601 strings in C; this gives the stdlib
+    fallback the same output.
+
+    Args:
+        obj: The object json.dumps could not serialize.
+
+    Returns:
+        str: The ISO 8601 representation of a datetime.
+
+    Raises:
+        TypeError: If the object is not a supported type.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_dumps(obj) -> str:
+    """
+    Serializes an object to a JSON string, preferring orjson when it is available.
+
+    Args:
+        obj: The JSON-serializable object (typically a dict) to encode.
+
+    Returns:
+        str: The compact JSON document as a string, as required by SQS message bodies and
+             Lambda responses.
+    """
+    if orjson is not None:
+        # orjson returns bytes, so decode them back into a str.
+        return orjson.dumps(obj).decode()
+    # Use compact separators and raw (non-escaped) Unicode so the fallback emits the same output
+    # as orjson, rather than the standard library's default ', ' / ': ' padding and \uXXXX escapes.
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+
+def _json_encode_batch(objs: list) -> list:
+    """
+    Serializes a batch of objects to UTF-8 encoded JSON documents in a single pass.
+    The encoder is resolved once for the whole batch, and the bytes are returned as-is so callers
+    that also need them (e.g., for hashing) do not have to re-encode the resulting strings.
+
+    Args:
+        objs (list): The JSON-serializable objects (typically tender dicts) to encode.
+
+    Returns:
+        list: One compact JSON document (bytes) per input object, in the same order.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+        return [dumps(obj) for obj in objs]
+    # Match orjson's output exactly (compact, raw UTF-8), since these bytes are also hashed into the
+    # SQS deduplication ID and must not depend on which encoder the layer provides.
+    dumps = json.dumps
+    return [dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode() for obj in objs]
+
+def _json_loads(data: bytes):
+    """
+    Parses a JSON document from raw bytes, preferring orjson when it is available.
+    Working on the raw bytes skips the intermediate decode into a str that response.json() performs.
+
+    Args:
+        data (bytes): The raw JSON document, such as an HTTP response body.
+
+    Returns:
+        The decoded Python object (for the Eskom API, a list of tender dictionaries).
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON. orjson.JSONDecodeError is a
+                              subclass of it, so callers only need to handle the stdlib error.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _ensure_json(response) -> None:
+    """
+    Rejects responses that declare a non-JSON content type before any decoding is attempted.
+    When the API is down it can answer with a 200 HTML error page; this lets us fail fast
+    instead of running the JSON parser over the entire page first.
+
+    Args:
+        response (requests.Response): The HTTP response from the Eskom API.
+
+    Raises:
+        ValueError: If the response has a Content-Type header that does not indicate JSON.
+                    Responses without a Content-Type header are let through to the parser.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if content_type and 'json' not in content_type.lower():
+        raise ValueError(f"non-JSON content-type: {content_type!r}")
+
+# ==================================================================================================
+# Helper: SQS Batch Dispatch
+# ==================================================================================================
+def _send_message_batch(batch: list, batch_number: int) -> int:
+    """
+    Sends a single batch of tender dictionaries to the SQS FIFO queue.
+    This is called from a thread pool, so several batches may be in flight at once.
+
+    Args:
+        batch (list): Up to SQS_BATCH_SIZE tender dictionaries to send.
+        batch_number (int): The position of this batch in the run, used for logging.
+
+    Returns:
+        int: The number of messages in the batch that SQS accepted. Failures are logged and
+             reported as zero so a single failed batch does not abort the whole run.
+    """
+    # Serialize the whole batch up front, then build the entries for the `send_message_batch` call.
+    # - 'Id' is a unique identifier for the message within the batch.
+    # - 'MessageBody' must be a string, so the encoded JSON is decoded back into one.
+    # - 'MessageGroupId' is required for FIFO queues to group messages. Messages within a batch
+    #   keep their order; because batches are sent concurrently, tenders in different batches may
+    #   arrive in any order, which is fine since each tender is processed independently downstream.
+    # - 'MessageDeduplicationId' is a content hash of the encoded bytes, which lets SQS drop duplicate
+    #   tenders without relying on the queue having content-based deduplication enabled.
+    entries = [
+        {
+            'Id': entry_id,
+            'MessageBody': encoded_body.decode(),
+            'MessageGroupId': SQS_MESSAGE_GROUP_ID,
+            'MessageDeduplicationId': hashlib.sha256(encoded_body).hexdigest(),
+        }
+        for entry_id, encoded_body in zip(SQS_ENTRY_IDS, _json_encode_batch(batch))
+    ]
+
+    # Send the batch to SQS inside a try-except block to handle potential sending failures.
+    try:
+        response = sqs_client.send_message_batch(
+            QueueUrl=SQS_QUEUE_URL,
+            Entries=entries
+        )
+        logger.info(f"Successfully sent batch {batch_number} of {len(entries)} messages to SQS.")
+        # Report the number of messages that were successfully sent in this batch.
+        return len(response.get('Successful', []))
+    except Exception as e:
+        # Log any errors that occur during the SQS call.
+        logger.error(f"Failed to send message batch {batch_number} to SQS: {e}")
+        return 0
 
 # ==================================================================================================
 # Lambda Function Handler
@@ -72,93 +267,91 @@ def lambda_handler(event, context):
     # --- Step 1: Fetch Data from the Eskom API ---
     try:
         logger.info(f"Fetching data from {ESKOM_API_URL}")
-        # Make a GET request to the API with a 30-second timeout.
-        response = requests.get(ESKOM_API_URL, headers=HEADERS, timeout=30)
+        # Make a GET request to the API using the shared session and the per-attempt timeout.
+        response = http_session.get(ESKOM_API_URL, timeout=ESKOM_API_TIMEOUT)
         # Check if the request was successful (i.e., status code 2xx). If not, raise an HTTPError.
         response.raise_for_status()
-        # Parse the JSON response body into a Python list of dictionaries.
-        api_data = response.json()
+        # Make sure the API actually returned JSON, then parse the raw response body into a
+        # Python list of dictionaries.
+        _ensure_json(response)
+        api_data = _json_loads(response.content)
         logger.info(f"Successfully fetched {len(api_data)} tender items from the API.")
     except requests.exceptions.RequestException as e:
         # Handle network-related errors (e.g., DNS failure, connection timeout).
         logger.error(f"Failed to fetch data from API: {e}")
-        return {'statusCode': 502, 'body': json.dumps({'error': 'Failed to fetch data from source API'})}
-    except json.JSONDecodeError:
-        # Handle cases where the API response is not valid JSON.
-        logger.error(f"Failed to decode JSON from API response. Response text: {response.text}")
-        return {'statusCode': 502, 'body': json.dumps({'error': 'Invalid JSON response from source API'})}
-
-    # --- Step 2: Process and Validate Each Tender Item ---
-    processed_tenders = []  # A list to store the successfully processed EskomTender objects.
-    skipped_count = 0       # A counter for tenders that could not be processed.
-
-    # Loop through each item received from the API.
-    for item in api_data:
-        try:
-            # Use the model's factory method to parse the raw dictionary into a structured object.
-            # This step performs validation and data cleaning.
-            tender_object = EskomTender.from_api_response(item)
-            # If successful, add the object to our list.
-            processed_tenders.append(tender_object)
-        except (KeyError, ValueError, TypeError) as e:
-            # Catch errors that occur during parsing, such as missing keys or invalid data types.
-            skipped_count += 1
-            # Get the tender ID for logging, defaulting to 'Unknown' if not found.
-            tender_id = item.get('TENDER_ID', 'Unknown')
-            logger.warning(f"Skipping tender {tender_id} due to a validation/parsing error: {e}")
-            continue  # Move to the next item in the loop.
-
-    logger.info(f"Successfully processed {len(processed_tenders)} tenders.")
-    if skipped_count > 0:
-        logger.warning(f"Skipped a total of {skipped_count} tenders due to errors.")
+        return {'statusCode': 502, 'body': _json_dumps({'error': 'Failed to fetch data from source API'})}
+    except ValueError as e:
+        # Handle cases where the API response is not JSON or is not valid JSON. This covers
+        # json.JSONDecodeError (and orjson's subclass of it) as well as the content-type check.
+        # Only the start of the body is logged, since error pages can be large.
+        logger.error(f"Failed to decode JSON from API response: {e}. Response text: {response.text[:500]}")
+        return {'statusCode': 502, 'body': _json_dumps({'error': 'Invalid JSON response from source API'})}
 
-    # --- Step 3: Prepare Data for SQS ---
-    # Convert the list of EskomTender objects into a list of dictionaries.
-    processed_tender_dicts = [tender.to_dict() for tender in processed_tenders]
-
-    # --- Step 4: Batch and Send Messages to SQS ---
-    # SQS `send_message_batch` has a limit of 10 messages per call.
-    batch_size = 10
-    # Use a list comprehension to split the list of tenders into smaller "chunks" or "batches".
-    message_batches = [
-        processed_tender_dicts[i:i + batch_size]
-        for i in range(0, len(processed_tender_dicts), batch_size)
-    ]
+    # Release the raw response body now that it has been decoded, so the payload bytes and the
+    # decoded tender list do not both stay resident for the rest of the invocation.
+    del response
+
+    # --- Step 2: Process, Validate, and Send Each Tender Item ---
+    # Tenders are handed to the SQS thread pool as soon as a full batch is ready, so the sends
+    # overlap with processing and with each other instead of running one round trip at a time.
+    # The executor's work queue is unbounded and parsing is much faster than an SQS round trip,
+    # so at most 2 * SQS_MAX_WORKERS batches are kept in flight: once that many are pending, the
+    # loop waits for one to finish before submitting another. This bounds the tender dictionaries
+    # held in memory to a few dozen batches rather than the whole bulletin.
+    max_pending = 2 * SQS_MAX_WORKERS
+    batch = []            # The tender dictionaries waiting to be sent in the next SQS batch.
+    pending = set()       # The SQS sends that have been submitted but not yet collected.
+    batch_number = 0      # The number of batches submitted so far, used for logging.
+    processed_count = 0   # A counter for tenders that were successfully processed.
+    skipped_count = 0     # A counter for tenders that could not be processed.
+    sent_count = 0        # A counter for the total number of messages successfully sent.
+
+    with ThreadPoolExecutor(max_workers=SQS_MAX_WORKERS) as executor:
+        # Loop through each item received from the API.
+        for item in api_data:
+            # Parse the raw dictionary straight into its serialized form. This performs the same
+            # validation and data cleaning as from_api_response, without building an EskomTender
+            # object that would only be converted to a dictionary and discarded.
+            # Invalid items are reported as None instead of raising, so no exception handling
+            # is needed inside this loop.
+            tender_dict = EskomTender.dict_from_api_response(item)
+            if tender_dict is None:
+                skipped_count += 1
+                # Use the tender reference for logging, since the item has no usable TENDER_ID.
+                reference = item.get('REFERENCE', 'Unknown')
+                logger.warning("Skipping tender %s because it is missing a TENDER_ID.", reference)
+                continue  # Move to the next item in the loop.
+            batch.append(tender_dict)
+            processed_count += 1
+
+            # --- Step 3: Send Each Full Batch to SQS ---
+            if len(batch) == SQS_BATCH_SIZE:
+                if len(pending) >= max_pending:
+                    # Wait for at least one send to finish and collect its result before queuing more.
+                    # _send_message_batch handles its own errors, so every future resolves to the
+                    # number of messages accepted by SQS.
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    sent_count += sum(future.result() for future in done)
+                pending.add(executor.submit(_send_message_batch, batch, batch_number))
+                batch_number += 1
+                batch = []
 
-    sent_count = 0  # A counter for the total number of messages successfully sent.
-    # Iterate over each batch of tenders.
-    for batch in message_batches:
-        # Prepare the entries for the `send_message_batch` call.
-        entries = []
-        for i, tender_dict in enumerate(batch):
-            entries.append({
-                # 'Id' is a unique identifier for the message within the batch.
-                'Id': f'tender_message_{i}_{sent_count}',
-                # 'MessageBody' must be a string. We serialize the dictionary to a JSON string.
-                'MessageBody': json.dumps(tender_dict),
-                # 'MessageGroupId' is required for FIFO queues to group messages.
-                # All messages with the same group ID are processed in order.
-                'MessageGroupId': 'EskomTenderScrape'
-            })
-
-        # Send the batch to SQS inside a try-except block to handle potential sending failures.
-        try:
-            response = sqs_client.send_message_batch(
-                QueueUrl=SQS_QUEUE_URL,
-                Entries=entries
-            )
-            # Increment the counter by the number of messages that were successfully sent in this batch.
-            sent_count += len(response.get('Successful', []))
-            logger.info(f"Successfully sent a batch of {len(entries)} messages to SQS.")
-        except Exception as e:
-            # Log any errors that occur during the SQS call.
-            logger.error(f"Failed to send a message batch to SQS: {e}")
+        # Send any remaining tenders that did not fill a complete batch.
+        if batch:
+            pending.add(executor.submit(_send_message_batch, batch, batch_number))
 
+        # Collect the results of the sends that are still outstanding.
+        done, _ = wait(pending)
+        sent_count += sum(future.result() for future in done)
+
+    logger.info(f"Successfully processed {processed_count} tenders.")
+    if skipped_count > 0:
+        logger.warning(f"Skipped a total of {skipped_count} tenders due to errors.")
     logger.info(f"Processing complete. Sent a total of {sent_count} messages to SQS.")
 
-    # --- Step 5: Return a Success Response ---
+    # --- Step 4: Return a Success Response ---
     # This response is sent back to the invoker of the Lambda function.
     return {
         'statusCode': 200,
-        'body': json.dumps({'message': 'Tender data processed and sent to SQS queue.'})
+        'body': _json_dumps({'message': 'Tender data processed and sent to SQS queue.'})
     }
\ No newline at end of file
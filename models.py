@@ -8,66 +8,196 @@
 # to handle, validate, and serialize tender data.
 #
 # The classes defined here are:
-#   - SupportingDoc: A simple class to represent a downloadable document linked to a tender.
-#   - TenderBase: An abstract base class defining the common interface and core attributes
+#   - SupportingDoc: A simple NamedTuple to represent a downloadable document linked to a tender.
+#   - TenderBase: A base class defining the common interface and core attributes
 #     for any tender. This promotes consistency across different tender types.
 #   - EskomTender: A concrete class that inherits from TenderBase and adds fields
 #     specific to the data provided by the Eskom API. It includes logic for parsing
 #     the raw API response into a clean, usable object.
 #
+# The module also provides make_eskom_tender, the factory function behind
+# EskomTender.from_api_response.
+#
 # ==================================================================================================
 
 # Import necessary built-in modules.
-# abc (Abstract Base Classes) is used to define the basic structure of a tender.
 # datetime is used for handling and formatting date/time information.
 # logging is used to record warnings or errors during data parsing.
-from abc import ABC, abstractmethod
+# functools.lru_cache is used to memoize date parsing across tenders.
+# typing.NamedTuple is used to define the lightweight SupportingDoc record.
+# sys.intern is used to share one copy of strings that repeat across many tenders.
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
 import logging
+import sys
+
+# Module-level logger, looked up once rather than going through the root logger on every warning.
+logger = logging.getLogger(__name__)
+
+# The source name stamped on every Eskom tender, interned so all tenders share a single object.
+_SOURCE = sys.intern("Eskom")
+# The name of the supporting document linked to every Eskom tender; only its URL varies per tender.
+_DOC_NAME = sys.intern("Eskom Tender Bulletin")
+# The tender details URL, to which each tender's ID is appended to form its document link.
+_DOC_URL_PREFIX = "https://tenderbulletin.eskom.co.za/webapi/api/Lookup/GetTender?TENDER_ID="
+
+# ==================================================================================================
+# Helper: Text Cleaning
+# ==================================================================================================
+# Translation table used by _clean: newlines become spaces and carriage returns are removed.
+_CLEAN_TABLE = str.maketrans({'\n': ' ', '\r': None})
+
+def _clean(value: str) -> str:
+    """
+    Cleans a raw text field from the API in a single pass over the string.
+    str.translate applies both newline substitutions at once, so only one intermediate string
+    is created before stripping, instead of one per chained .replace() call.
+
+    Args:
+        value (str): The raw field value, which may be None or empty.
+
+    Returns:
+        str: The cleaned string, or '' if no value was provided. Both None and '' normalize
+             to '', so a null field from the API never raises.
+    """
+    return value.translate(_CLEAN_TABLE).strip() if value else ''
+
+def _intern_title(value: str) -> str:
+    """
+    Title-cases a cleaned value and interns the result. Used for fields such as audience, office,
+    and province that come from a small set of values repeated across the bulletin, so all tenders
+    share one copy of each value instead of holding their own.
+    """
+    return sys.intern(value.title())
+
+# The text fields of an EskomTender, as (attribute name, Eskom API key, normalizer) entries.
+# _parse_api_fields builds all of them in one loop over this table, and each
+# normalizer standardizes the case of the cleaned value.
+_TEXT_FIELDS = (
+    ('title', 'HEADER_DESC', str.title),
+    ('description', 'SCOPE_DETAILS', str.title),
+    ('tender_number', 'REFERENCE', str.upper),
+    ('audience', 'Audience', _intern_title),
+    ('office_location', 'OFFICE_LOCATION', _intern_title),
+    ('email', 'EMAIL', str.lower),
+    ('address', 'ADDRESS', str.title),
+    ('province', 'Province', _intern_title),
+)
+
+# ==================================================================================================
+# Helper: Date Parsing
+# ==================================================================================================
+def _parse_iso(value):
+    """
+    Parses an ISO 8601 date value from the API into a datetime object without raising.
+    Anything that cannot be a date (None, non-strings, or strings shorter than YYYY-MM-DD)
+    is rejected by a cheap shape check before any parsing is attempted.
+
+    Args:
+        value: The raw date value from the API, expected to be an ISO 8601 string.
+
+    Returns:
+        datetime | None: The parsed datetime, or None if the value is missing or invalid.
+    """
+    if isinstance(value, str) and len(value) >= 10:
+        return _parse_iso_string(value)
+    return None
+
+@lru_cache(maxsize=4096)
+def _parse_iso_string(value: str, _fromisoformat=datetime.fromisoformat):
+    """
+    Parses an ISO 8601 date string, memoizing the result. Tenders in a single bulletin share
+    many publication and closing dates, so repeated strings are served from the cache instead
+    of being parsed again. Invalid strings are cached as None as well.
+
+    Args:
+        value (str): The ISO 8601 date string from the API.
+        _fromisoformat: Internal. datetime.fromisoformat, bound once at definition time so each
+                        cache miss reads a local instead of looking the method up on datetime.
+
+    Returns:
+        datetime | None: The parsed datetime, or None if the string is not a valid ISO 8601 date.
+                         Because datetime objects are immutable, the cached instance can safely
+                         be shared between tenders.
+    """
+    # fromisoformat is implemented in C and is already the fastest way to parse the API's fixed
+    # YYYY-MM-DDTHH:MM:SS format; hand-slicing the string into int() calls is several times slower.
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return None
+
+# ==================================================================================================
+# Helper: Serialization
+# ==================================================================================================
+def _eskom_tender_dict(title, description, source, published_date, closing_date, supporting_docs, tags,
+                       tender_number, audience, office_location, email, address, province):
+    """
+    Builds the serialized dictionary form of an Eskom tender. This is the single definition of the
+    output layout, shared by EskomTender.to_dict and EskomTender.dict_from_api_response so the keys
+    cannot drift apart between the object and object-free paths. The whole dictionary is one literal,
+    so only one correctly sized dict is allocated per tender.
+
+    Returns:
+        dict: The complete dictionary representation of the Eskom tender. Dates are left as datetime
+              objects (or None); the JSON encoder in the Lambda handler formats them as ISO 8601
+              strings natively.
+    """
+    return {
+        "title": title,
+        "description": description,
+        "source": source,
+        "publishedDate": published_date,
+        "closingDate": closing_date,
+        # Serialize each SupportingDoc and each tag object (if any).
+        "supporting_docs": [doc._asdict() for doc in supporting_docs],
+        "tags": [tag.to_dict() for tag in tags],
+        # Eskom-specific fields.
+        "tenderNumber": tender_number,
+        "audience": audience,
+        "officeLocation": office_location,
+        "email": email,
+        "address": address,
+        "province": province
+    }
 
 # ==================================================================================================
 # Class: SupportingDoc
 # Purpose: Represents a single supporting document associated with a tender.
 # ==================================================================================================
-class SupportingDoc:
+class SupportingDoc(NamedTuple):
     """
     A simple data class to hold information about a supporting document.
     This typically includes tender specifications, forms, or other relevant files.
-    """
-    def __init__(self, name: str, url: str):
-        """
-        Initializes a new instance of the SupportingDoc class.
 
-        Args:
-            name (str): The human-readable name of the document (e.g., "Tender Specifications.pdf").
-            url (str): The direct URL where the document can be downloaded.
-        """
-        # --- Instance Attributes ---
-        self.name = name  # The title or filename of the document.
-        self.url = url    # The hyperlink to the document.
+    As a NamedTuple it is a C-backed tuple with no per-instance __dict__, is cheap to create,
+    and serializes to a {"name": ..., "url": ...} dictionary via the built-in _asdict().
 
-    def to_dict(self):
-        """
-        Serializes the SupportingDoc instance into a dictionary format.
-        This is useful for converting the object into a JSON string for APIs or storage.
-
-        Returns:
-            dict: A dictionary containing the document's name and URL.
-        """
-        return {"name": self.name, "url": self.url}
+    Attributes:
+        name (str): The human-readable name of the document (e.g., "Tender Specifications.pdf").
+        url (str): The direct URL where the document can be downloaded.
+    """
+    name: str  # The title or filename of the document.
+    url: str   # The hyperlink to the document.
 
 # ==================================================================================================
-# Class: TenderBase (Abstract Base Class)
+# Class: TenderBase (Base Class)
 # Purpose: Defines the fundamental structure and contract for all tender types.
 # ==================================================================================================
-class TenderBase(ABC):
+class TenderBase:
     """
-    An abstract base class that serves as a template for all specific tender models.
+    A base class that serves as a template for all specific tender models.
     It defines the common attributes and methods that every tender object must have,
     ensuring a consistent data structure regardless of the data source.
-    This class cannot be instantiated directly.
+    It is a plain class rather than an ABC, so constructing a tender skips the ABCMeta
+    machinery; subclasses are expected to override from_api_response.
     """
-    def __init__(self, title: str, description: str, source: str, published_date: datetime, closing_date: datetime, supporting_docs: list = None, tags: list = None):
+    # Declaring __slots__ stores attributes in fixed slots instead of a per-instance __dict__,
+    # which roughly halves the memory used by each tender and speeds up attribute access.
+    __slots__ = ('closing_date', 'description', 'published_date', 'source', 'supporting_docs', 'tags', 'title')
+
+    def __init__(self, title: str, description: str, source: str, published_date: datetime, closing_date: datetime, supporting_docs: tuple = None, tags: list = None):
         """
         Initializes the base attributes of a tender.
 
@@ -77,7 +207,8 @@ class TenderBase(ABC):
             source (str): The name of the platform where the tender was found (e.g., "Eskom").
             published_date (datetime): The date and time when the tender was officially published.
             closing_date (datetime): The date and time when submissions for the tender are due.
-            supporting_docs (list, optional): A list of SupportingDoc objects. Defaults to an empty list.
+            supporting_docs (tuple, optional): A sequence of SupportingDoc objects, normally a tuple since
+                                               the documents are fixed once parsed. Defaults to an empty tuple.
             tags (list, optional): A list of keywords or categories for the tender. Defaults to an empty list.
                                    This is intentionally left empty to be populated by a downstream AI service.
         """
@@ -87,46 +218,51 @@ class TenderBase(ABC):
         self.source = source
         self.published_date = published_date
         self.closing_date = closing_date
-        # If supporting_docs is not provided, initialize as an empty list to prevent errors.
-        self.supporting_docs = supporting_docs if supporting_docs is not None else []
+        # If supporting_docs is not provided, initialize as an empty tuple to prevent errors.
+        self.supporting_docs = supporting_docs if supporting_docs is not None else ()
         # If tags is not provided, initialize as an empty list. This is the standard behavior
         # as the tags are expected to be added by a separate AI tagging process later.
         self.tags = tags if tags is not None else []
 
     @classmethod
-    @abstractmethod
     def from_api_response(cls, response_item: dict):
         """
-        An abstract factory method that must be implemented by all subclasses.
+        A factory method that must be implemented by all subclasses.
         Its purpose is to create a tender object from a single item (dictionary)
         from a raw API response.
 
         Args:
             response_item (dict): A dictionary representing one tender from the source API.
 
+        Returns:
+            TenderBase | None: The new tender. Subclasses may return None for an item that fails
+                               validation instead of raising, so callers must check the result.
+
         Raises:
             NotImplementedError: If a subclass does not implement this method.
         """
-        pass
+        raise NotImplementedError(f"{cls.__name__} must implement from_api_response")
 
     def to_dict(self):
         """
-        Serializes the common tender attributes into a dictionary.
-        This method is intended to be called by subclasses, which will then add their
-        own specific fields to the dictionary.
+        Serializes the common tender attributes into a dictionary. Subclasses override this to
+        include their own fields; their dictionaries start with these same keys, in this order.
 
         Returns:
-            dict: A dictionary containing the core attributes of the tender.
+            dict: A dictionary containing the core attributes of the tender. Dates are returned
+                  as datetime objects; encode the dictionary with orjson (or json.dumps with a
+                  default that calls isoformat()) to serialize them as ISO 8601 strings.
         """
         return {
             "title": self.title,
             "description": self.description,
             "source": self.source,
-            # Convert datetime objects to ISO 8601 format string, handling None values gracefully.
-            "publishedDate": self.published_date.isoformat() if self.published_date else None,
-            "closingDate": self.closing_date.isoformat() if self.closing_date else None,
+            # Dates are left as datetime objects (or None). The JSON encoder in the Lambda handler
+            # formats them as ISO 8601 strings natively, so no string is built here.
+            "publishedDate": self.published_date,
+            "closingDate": self.closing_date,
             # Serialize each SupportingDoc object in the list.
-            "supporting_docs": [doc.to_dict() for doc in self.supporting_docs],
+            "supporting_docs": [doc._asdict() for doc in self.supporting_docs],
             # Serialize each tag object in the list (if any).
             "tags": [tag.to_dict() for tag in self.tags]
         }
@@ -140,10 +276,14 @@ class EskomTender(TenderBase):
     Represents a tender sourced from Eskom. It inherits all the base attributes
     from TenderBase and adds additional fields that are unique to the Eskom API data structure.
     """
+    # Only the Eskom-specific attributes are declared here; the base attributes are slotted in TenderBase.
+    # '_dict' holds the cached result of to_dict().
+    __slots__ = ('_dict', 'address', 'audience', 'email', 'office_location', 'province', 'tender_number')
+
     def __init__(
         self,
         # --- Base fields required by TenderBase ---
-        title: str, description: str, source: str, published_date: datetime, closing_date: datetime, supporting_docs: list, tags: list,
+        title: str, description: str, source: str, published_date: datetime, closing_date: datetime, supporting_docs: tuple, tags: list,
         # --- Child fields specific to EskomTender ---
         tender_number: str,
         audience: str,
@@ -173,64 +313,32 @@ class EskomTender(TenderBase):
         self.email = email
         self.address = address
         self.province = province
+        # The serialized form is built lazily on the first to_dict() call.
+        self._dict = None
 
     @classmethod
-    def from_api_response(cls, response_item: dict):
+    def dict_from_api_response(cls, response_item: dict):
         """
-        Factory method to create an EskomTender object from a raw Eskom API response item.
-        This method handles data extraction, cleaning, and validation.
+        Parses a raw Eskom API response item straight into its serialized dictionary form.
+        This produces the same result as from_api_response(item).to_dict(), but skips creating
+        an intermediate EskomTender object that would only be serialized and thrown away.
 
         Args:
             response_item (dict): A dictionary containing a single tender's data from the Eskom API.
 
         Returns:
-            EskomTender: An instance of the EskomTender class populated with the API data.
+            dict | None: A complete dictionary representation of the Eskom tender, or None if
+                         the item failed validation.
         """
-        # Extract the tender ID, which is used for creating a document link.
-        tender_id = response_item['TENDER_ID']
-
-        # Eskom's API does not provide direct document links. We construct a link to the
-        # tender details page, which acts as the primary "supporting document".
-        doc_url = f"https://tenderbulletin.eskom.co.za/webapi/api/Lookup/GetTender?TENDER_ID={tender_id}"
-        doc_list = [SupportingDoc(name="Eskom Tender Bulletin", url=doc_url)]
-
-        # --- Date Parsing with Error Handling ---
-        # Attempt to parse the published date string into a datetime object.
-        try:
-            pub_date = datetime.fromisoformat(response_item['PUBLISHEDDATE'])
-        except (TypeError, ValueError):
-            # If the date is missing, null, or in an invalid format, set it to None
-            # and log a warning for monitoring purposes.
-            pub_date = None
-            logging.warning(f"Tender {tender_id} has invalid PUBLISHEDDATE: {response_item.get('PUBLISHEDDATE')}")
-        # Attempt to parse the closing date string into a datetime object.
-        try:
-            close_date = datetime.fromisoformat(response_item['CLOSING_DATE'])
-        except (TypeError, ValueError):
-            # If the date is missing, null, or in an invalid format, set it to None
-            # and log a warning.
-            close_date = None
-            logging.warning(f"Tender {tender_id} has invalid CLOSING_DATE: {response_item.get('CLOSING_DATE')}")
-
-        # Create and return an instance of the EskomTender class.
-        # .get() is used to safely access dictionary keys that might be missing.
-        # .replace() and .strip() are used to clean string data by removing newline
-        # characters and leading/trailing whitespace.
-        # String methods like .title(), .upper(), and .lower() are used to standardize the text format.
-        return cls(
-            title=response_item.get('HEADER_DESC', '').replace('\n', ' ').replace('\r', '').strip().title(),
-            description=response_item.get('SCOPE_DETAILS', '').replace('\n', ' ').replace('\r', '').strip().title(),
-            source="Eskom",  # Hardcoded source for this class.
-            published_date=pub_date,
-            closing_date=close_date,
-            supporting_docs=doc_list,
-            tags=[],  # Initialize tags as an empty list, ready for the AI service.
-            tender_number=response_item.get('REFERENCE', '').replace('\n', ' ').replace('\r', '').strip().upper(),
-            audience=response_item.get('Audience', '').replace('\n', ' ').replace('\r', '').strip().title(),
-            office_location=response_item.get('OFFICE_LOCATION', '').replace('\n', ' ').replace('\r', '').strip().title(),
-            email=response_item.get('EMAIL', '').replace('\n', ' ').replace('\r', '').strip().lower(),
-            address=response_item.get('ADDRESS', '').replace('\n', ' ').replace('\r', '').strip().title(),
-            province=response_item.get('Province', '').replace('\n', ' ').replace('\r', '').strip().title()
+        fields = _parse_api_fields(response_item)
+        if fields is None:
+            return None
+        # The fields are passed positionally, which binds faster than unpacking the dict with **.
+        return _eskom_tender_dict(
+            fields['title'], fields['description'], fields['source'], fields['published_date'],
+            fields['closing_date'], fields['supporting_docs'], fields['tags'],
+            fields['tender_number'], fields['audience'], fields['office_location'], fields['email'],
+            fields['address'], fields['province'],
         )
 
     def to_dict(self):
@@ -238,19 +346,113 @@ class EskomTender(TenderBase):
         Serializes the EskomTender object to a dictionary, including both
         base and Eskom-specific fields.
 
+        The dictionary is built on the first call and cached, so serializing the same tender
+        again (e.g., for logging and for the queue) is a single attribute read. Because of this,
+        changing a tender's attributes after its first to_dict() call is not supported, and the
+        returned dictionary is shared between calls and must not be modified.
+
         Returns:
-            dict: A complete dictionary representation of the Eskom tender.
+            dict: A complete dictionary representation of the Eskom tender. As with
+                  TenderBase.to_dict, dates are returned as datetime objects for the JSON encoder.
         """
-        # Get the dictionary of base fields from the parent class.
-        data = super().to_dict()
-        # Add the Eskom-specific fields to the dictionary.
-        data.update({
-            "tenderNumber": self.tender_number,
-            "audience": self.audience,
-            "officeLocation": self.office_location,
-            "email": self.email,
-            "address": self.address,
-            "province": self.province
-        })
-        # Return the final, combined dictionary.
-        return data
\ No newline at end of file
+        data = self._dict
+        if data is None:
+            # Build the complete dictionary in a single literal instead of extending the parent's
+            # dictionary, so only one correctly sized dict is allocated per tender.
+            data = self._dict = _eskom_tender_dict(
+                self.title, self.description, self.source, self.published_date, self.closing_date,
+                self.supporting_docs, self.tags,
+                self.tender_number, self.audience, self.office_location, self.email, self.address,
+                self.province,
+            )
+        return data
+
+# ==================================================================================================
+# Function: _parse_api_fields
+# Purpose: Parses a raw Eskom API response item into the arguments for an EskomTender.
+# ==================================================================================================
+def _parse_api_fields(response_item: dict):
+    """
+    Extracts, cleans, and validates the fields of a raw Eskom API response item.
+    This is shared by make_eskom_tender and EskomTender.dict_from_api_response so that every
+    path applies exactly the same parsing rules; as a plain function it is called without an
+    attribute lookup on EskomTender. Validation failures are reported by returning None rather
+    than raising, which keeps exception handling out of the per-tender loop.
+
+    Args:
+        response_item (dict): A dictionary containing a single tender's data from the Eskom API.
+
+    Returns:
+        dict | None: The keyword arguments required to construct an EskomTender, or None if
+                     the item is missing its TENDER_ID.
+    """
+    # Extract the tender ID, which is used for creating a document link.
+    # A tender without an ID cannot be linked back to the bulletin, so it is rejected.
+    tender_id = response_item.get('TENDER_ID')
+    if tender_id is None:
+        return None
+
+    # Eskom's API does not provide direct document links. We construct a link to the
+    # tender details page, which acts as the primary "supporting document".
+    # A plain concatenation avoids the f-string formatting machinery for this single substitution.
+    doc_url = _DOC_URL_PREFIX + str(tender_id)
+    # The documents never change after parsing, so a tuple is used instead of a list: it has
+    # no over-allocation and needs no mutable container per tender.
+    doc_list = (SupportingDoc(_DOC_NAME, doc_url),)
+
+    # --- Date Parsing ---
+    get = response_item.get
+    published = get('PUBLISHEDDATE')
+    closing = get('CLOSING_DATE')
+    # Parse the date strings into datetime objects. Missing, null, or invalid dates become
+    # None; a warning is logged for monitoring purposes only when a value was actually
+    # provided but could not be parsed. The %-style arguments defer message formatting to
+    # the logging module, which skips it entirely if warnings are disabled.
+    pub_date = _parse_iso(published)
+    if pub_date is None and published:
+        logger.warning("Tender %s has invalid PUBLISHEDDATE: %s", tender_id, published)
+    close_date = _parse_iso(closing)
+    if close_date is None and closing:
+        logger.warning("Tender %s has invalid CLOSING_DATE: %s", tender_id, closing)
+
+    # Build the constructor arguments.
+    # The text fields are driven by the _TEXT_FIELDS table: _clean() removes newline characters
+    # and leading/trailing whitespace (mapping missing values to ''), then each field's
+    # normalizer (.title(), .upper(), or .lower()) standardizes the text format.
+    fields = {attr: normalize(_clean(get(key))) for attr, key, normalize in _TEXT_FIELDS}
+    fields.update(
+        source=_SOURCE,  # Hardcoded source for this class.
+        published_date=pub_date,
+        closing_date=close_date,
+        supporting_docs=doc_list,
+        tags=[],  # Initialize tags as an empty list, ready for the AI service.
+    )
+    return fields
+
+# ==================================================================================================
+# Function: make_eskom_tender
+# Purpose: The factory that builds EskomTender objects from raw Eskom API response items.
+# ==================================================================================================
+def make_eskom_tender(response_item: dict) -> EskomTender | None:
+    """
+    Factory function to create an EskomTender object from a raw Eskom API response item.
+    This function handles data extraction, cleaning, and validation. It is a plain module-level
+    function so that callers in tight loops avoid the classmethod descriptor and bound-method
+    allocation on every call; EskomTender.from_api_response is an alias of it.
+
+    Args:
+        response_item (dict): A dictionary containing a single tender's data from the Eskom API.
+
+    Returns:
+        EskomTender | None: An instance of the EskomTender class populated with the API data, or
+                            None if the item is missing its TENDER_ID. Invalid items are reported
+                            as None rather than raising, so bulk callers can skip them with a
+                            simple check instead of catching exceptions.
+    """
+    fields = _parse_api_fields(response_item)
+    if fields is None:
+        return None
+    return EskomTender(**fields)
+
+# Keep EskomTender.from_api_response available for existing callers and the TenderBase interface.
+EskomTender.from_api_response = staticmethod(make_eskom_tender)
@@ -1,5 +1,9 @@
 import unittest
 import json
+import hashlib
+import threading
+import time
+from datetime import datetime
 from unittest.mock import patch, Mock
 import sys
 import os
@@ -13,22 +17,21 @@ import lambda_handler
 
 class TestEskomLambdaHandler(unittest.TestCase):
 
-    @patch('lambda_handler.requests.get')
+    @patch('lambda_handler.http_session.get')
     @patch('lambda_handler.sqs_client.send_message_batch')
-    @patch('lambda_handler.EskomTender.from_api_response')
+    @patch('lambda_handler.EskomTender.dict_from_api_response')
     def test_lambda_handler_success(self, mock_from_api, mock_sqs, mock_get):
-        with open(os.path.join('unit_test', 'test_data', 'sample_eskom.json'), 'r') as f:
-            sample_data = json.load(f)
+        with open(os.path.join('unit_test', 'test_data', 'sample_eskom.json'), 'rb') as f:
+            sample_data = f.read()
 
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_response.json = lambda: sample_data
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = sample_data
         mock_get.return_value = mock_response
 
-        mock_tender = Mock()
-        mock_tender.to_dict.return_value = {"title": "Valid Eskom Tender"}
-        mock_from_api.return_value = mock_tender
+        mock_from_api.return_value = {"title": "Valid Eskom Tender"}
 
         mock_sqs.return_value = {"Successful": [{"Id": "tender_message_0_0"}]}
 
@@ -36,38 +39,39 @@ class TestEskomLambdaHandler(unittest.TestCase):
         self.assertEqual(result['statusCode'], 200)
         self.assertIn("Tender data processed", result['body'])
 
-    @patch('lambda_handler.requests.get')
+    @patch('lambda_handler.http_session.get')
     def test_lambda_handler_fetch_fail(self, mock_get):
         mock_get.side_effect = lambda_handler.requests.exceptions.RequestException("Network error")
         result = lambda_handler.lambda_handler({}, {})
         self.assertEqual(result['statusCode'], 502)
         self.assertIn("Failed to fetch data from source API", result['body'])
 
-    @patch('lambda_handler.requests.get')
+    @patch('lambda_handler.http_session.get')
     def test_lambda_handler_invalid_json(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = b"<html>Service Unavailable</html>"
+        mock_response.text = "<html>Service Unavailable</html>"
         mock_get.return_value = mock_response
 
         result = lambda_handler.lambda_handler({}, {})
         self.assertEqual(result['statusCode'], 502)
         self.assertIn("Invalid JSON response", result['body'])
 
-    @patch('lambda_handler.requests.get')
+    @patch('lambda_handler.http_session.get')
     @patch('lambda_handler.sqs_client.send_message_batch')
-    @patch('lambda_handler.EskomTender.from_api_response')
+    @patch('lambda_handler.EskomTender.dict_from_api_response')
     def test_lambda_handler_with_sqs_failure(self, mock_from_api, mock_sqs, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_response.json = lambda: [{"TENDER_ID": "123"}]
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = json.dumps([{"TENDER_ID": "123"}]).encode()
         mock_get.return_value = mock_response
 
-        mock_tender = Mock()
-        mock_tender.to_dict.return_value = {"title": "Valid Eskom Tender"}
-        mock_from_api.return_value = mock_tender
+        mock_from_api.return_value = {"title": "Valid Eskom Tender"}
 
         mock_sqs.return_value = {
             "Successful": [],
@@ -78,5 +82,112 @@ class TestEskomLambdaHandler(unittest.TestCase):
         self.assertEqual(result['statusCode'], 200)
         self.assertIn("Tender data processed", result['body'])
 
+    @patch('lambda_handler.http_session.get')
+    @patch('lambda_handler.sqs_client.send_message_batch')
+    @patch('lambda_handler.EskomTender.dict_from_api_response')
+    def test_lambda_handler_flushes_batches_incrementally(self, mock_from_api, mock_sqs, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = json.dumps([{"TENDER_ID": str(i)} for i in range(25)]).encode()
+        mock_get.return_value = mock_response
+
+        mock_from_api.return_value = {"title": "Valid Eskom Tender"}
+        mock_sqs.side_effect = lambda QueueUrl, Entries: {"Successful": [{"Id": e["Id"]} for e in Entries]}
+
+        result = lambda_handler.lambda_handler({}, {})
+        self.assertEqual(result['statusCode'], 200)
+        # Batches are sent concurrently, so compare sizes without relying on call order.
+        batch_sizes = sorted(len(call.kwargs['Entries']) for call in mock_sqs.call_args_list)
+        self.assertEqual(batch_sizes, [5, 10, 10])
+
+    @patch('lambda_handler.http_session.get')
+    @patch('lambda_handler.sqs_client.send_message_batch')
+    def test_lambda_handler_message_ids_and_deduplication(self, mock_sqs, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = json.dumps(
+            [{"TENDER_ID": str(i), "HEADER_DESC": f"Tender {i}", "ADDRESS": "Café"} for i in range(15)]
+        ).encode()
+        mock_get.return_value = mock_response
+
+        mock_sqs.side_effect = lambda QueueUrl, Entries: {"Successful": [{"Id": e["Id"]} for e in Entries]}
+
+        result = lambda_handler.lambda_handler({}, {})
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(mock_sqs.call_count, 2)
+        for call in mock_sqs.call_args_list:
+            entries = call.kwargs['Entries']
+            ids = [entry['Id'] for entry in entries]
+            self.assertEqual(len(set(ids)), len(ids))
+            for entry in entries:
+                expected = hashlib.sha256(entry['MessageBody'].encode()).hexdigest()
+                self.assertEqual(entry['MessageDeduplicationId'], expected)
+
+    @patch('lambda_handler.SQS_MAX_WORKERS', 2)
+    @patch('lambda_handler.http_session.get')
+    @patch('lambda_handler.sqs_client.send_message_batch')
+    @patch('lambda_handler.EskomTender.dict_from_api_response')
+    def test_lambda_handler_bounds_batches_in_flight(self, mock_from_api, mock_sqs, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
+        mock_response.content = json.dumps([{"TENDER_ID": str(i)} for i in range(500)]).encode()
+        mock_get.return_value = mock_response
+
+        # Track how many parsed tenders have not yet been sent whenever another one is parsed.
+        lock = threading.Lock()
+        state = {"parsed": 0, "sent": 0, "max_held": 0}
+
+        def parse(item):
+            with lock:
+                state["parsed"] += 1
+                state["max_held"] = max(state["max_held"], state["parsed"] - state["sent"])
+            return {"title": "Valid Eskom Tender"}
+
+        def send(QueueUrl, Entries):
+            time.sleep(0.005)
+            with lock:
+                state["sent"] += len(Entries)
+            return {"Successful": [{"Id": e["Id"]} for e in Entries]}
+
+        mock_from_api.side_effect = parse
+        mock_sqs.side_effect = send
+
+        result = lambda_handler.lambda_handler({}, {})
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(state["sent"], 500)
+        # At most 2 * SQS_MAX_WORKERS batches are pending, plus the batch being filled.
+        self.assertLessEqual(state["max_held"], (2 * 2 + 1) * lambda_handler.SQS_BATCH_SIZE)
+
+    @patch('lambda_handler.http_session.get')
+    def test_lambda_handler_non_json_content_type(self, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.content = b"<html>Maintenance</html>"
+        mock_response.text = "<html>Maintenance</html>"
+        mock_get.return_value = mock_response
+
+        result = lambda_handler.lambda_handler({}, {})
+        self.assertEqual(result['statusCode'], 502)
+        self.assertIn("Invalid JSON response", result['body'])
+
+    def test_json_encoding_formats_dates(self):
+        tender_dict = {"publishedDate": datetime(2025, 10, 1, 9, 0), "closingDate": None}
+        encoded = lambda_handler._json_encode_batch([tender_dict])
+        self.assertEqual(json.loads(encoded[0]), {"publishedDate": "2025-10-01T09:00:00", "closingDate": None})
+        self.assertEqual(json.loads(lambda_handler._json_dumps(tender_dict)), json.loads(encoded[0]))
+
+        # Non-ASCII text must be emitted as raw UTF-8 by both encoders, since the bytes feed the
+        # SQS deduplication ID.
+        self.assertEqual(lambda_handler._json_encode_batch([{"t": "Café"}]), ['{"t":"Café"}'.encode()])
+        self.assertEqual(lambda_handler._json_dumps({"t": "Café"}), '{"t":"Café"}')
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime
-from models import EskomTender, SupportingDoc
+from models import EskomTender, SupportingDoc, TenderBase, make_eskom_tender
 
 class TestEskomModels(unittest.TestCase):
 
@@ -45,6 +45,66 @@ class TestEskomModels(unittest.TestCase):
         self.assertIsNone(tender.published_date)
         self.assertIsNone(tender.closing_date)
 
+    def test_make_eskom_tender_matches_from_api_response(self):
+        sample = {"TENDER_ID": "123", "HEADER_DESC": "upgrade of substation", "REFERENCE": "mwp1234ps"}
+
+        tender = make_eskom_tender(sample)
+        self.assertIsInstance(tender, EskomTender)
+        self.assertEqual(tender.title, "Upgrade Of Substation")
+        self.assertEqual(tender.to_dict(), EskomTender.from_api_response(sample).to_dict())
+
+    def test_null_email_is_normalized(self):
+        tender = EskomTender.from_api_response({"TENDER_ID": "123", "EMAIL": None})
+        self.assertEqual(tender.email, "")
+
+    def test_missing_tender_id_is_rejected(self):
+        sample = {"TENDER_ID": None, "HEADER_DESC": "Missing ID Tender"}
+
+        self.assertIsNone(EskomTender.from_api_response(sample))
+        self.assertIsNone(make_eskom_tender({"HEADER_DESC": "No ID Key"}))
+        self.assertIsNone(EskomTender.dict_from_api_response(sample))
+
+    def test_missing_date_keys_do_not_raise(self):
+        data = EskomTender.dict_from_api_response({"TENDER_ID": "123"})
+        self.assertIsNone(data["publishedDate"])
+        self.assertIsNone(data["closingDate"])
+
+    def test_repeated_dates_are_parsed_once(self):
+        sample = {"TENDER_ID": "123", "PUBLISHEDDATE": "2025-10-01T09:00:00", "CLOSING_DATE": "2025-10-31T16:00:00"}
+
+        first = EskomTender.from_api_response(sample)
+        second = EskomTender.from_api_response(dict(sample, TENDER_ID="456"))
+        self.assertEqual(first.published_date, datetime(2025, 10, 1, 9, 0))
+        self.assertIs(first.published_date, second.published_date)
+        self.assertIs(first.closing_date, second.closing_date)
+
+    def test_repeated_short_values_are_shared(self):
+        first = EskomTender.from_api_response({"TENDER_ID": "1", "Province": "gauteng\n"})
+        second = EskomTender.from_api_response({"TENDER_ID": "2", "Province": "GAUTENG"})
+        self.assertEqual(first.province, "Gauteng")
+        self.assertIs(first.province, second.province)
+        self.assertIs(first.source, second.source)
+
+    def test_dict_from_api_response_matches_to_dict(self):
+        sample = {
+            "TENDER_ID": "123",
+            "HEADER_DESC": "Upgrade of Substation",
+            "SCOPE_DETAILS": "Full electrical overhaul",
+            "PUBLISHEDDATE": "2025-10-01T09:00:00",
+            "CLOSING_DATE": "2025-10-31T16:00:00",
+            "REFERENCE": "mwp1234ps",
+            "Audience": "Suppliers",
+            "OFFICE_LOCATION": "Megawatt Park",
+            "EMAIL": "Tenders@Eskom.co.za",
+            "ADDRESS": "1 Maxwell Drive, Sunninghill",
+            "Province": "Gauteng"
+        }
+
+        data = EskomTender.dict_from_api_response(sample)
+        self.assertEqual(data, EskomTender.from_api_response(sample).to_dict())
+        self.assertEqual(data["tenderNumber"], "MWP1234PS")
+        self.assertEqual(data["publishedDate"], datetime(2025, 10, 1, 9, 0))
+
     def test_to_dict_structure(self):
         tender = EskomTender(
             title="Substation Upgrade",
@@ -62,9 +122,15 @@ class TestEskomModels(unittest.TestCase):
             province="Gauteng"
         )
         data = tender.to_dict()
+        self.assertIs(tender.to_dict(), data)
         self.assertEqual(data["title"], "Substation Upgrade")
         self.assertEqual(data["supporting_docs"][0]["url"], "https://example.com")
         self.assertEqual(data["email"], "tenders@eskom.co.za")
+        self.assertEqual(list(data), [
+            "title", "description", "source", "publishedDate", "closingDate", "supporting_docs", "tags",
+            "tenderNumber", "audience", "officeLocation", "email", "address", "province",
+        ])
+        self.assertEqual(list(TenderBase.to_dict(tender)), list(data)[:7])
 
 if __name__ == '__main__':
     unittest.main()